@@ -1,27 +1,35 @@
 """Unofficial SEC API wrapper."""
-import json
+import asyncio
 import os
 import re
+import shutil
 import sys
+import tempfile
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from multiprocessing import Pool, cpu_count
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import Dict, Literal, Optional, Set, Union, List, Tuple
+from weakref import finalize
 
 import feedparser
+import httpx
 import numpy as np
+import orjson
 import pandas as pd
-import requests
 
 from Modules.EDGAR.client._DownloadFormManager import DownloadFormManager
+from _AsyncBaseClient import run_coroutine_sync
 from _BaseClient import BaseClient
 from _constants import (
-    SUPPORTED_FORMS, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE,
+    CIK_LENGTH, MAX_REQUESTS_PER_SECOND, SUPPORTED_FORMS, DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE,
     ROOT_FACTS_SAVE_FOLDER_NAME, ROOT_FORMS_SAVE_FOLDER_NAME,
     HOST_WWW_SEC, STANDARD_HEADERS, URL_XBRL_COMPANY_CONCEPTS, URL_XBRL_FRAMES, URL_XBRL_COMPANY_FACTS, URL_SUBMISSIONS,
-    URL_PAGINATED_SUBMISSIONS, URL_XBRL_COMPANY_SUBMISSIONS_ZIP, URL_XBRL_COMPANY_FACTS_ZIP
+    URL_PAGINATED_SUBMISSIONS, URL_XBRL_COMPANY_SUBMISSIONS_ZIP, URL_XBRL_COMPANY_FACTS_ZIP, ZIP_DOWNLOAD_CHUNK_SIZE,
+    TICKER_CIK_CACHE_FILENAME, TICKER_CIK_CACHE_TTL_SECONDS,
 )
 from _types import FormsDownloadMetadata, DownloadPath, JSONType
 from _utils import merge_submission_dicts, validate_and_return_cik, validate_and_parse_date, get_valid_after_date
@@ -29,13 +37,108 @@ from logger import setup_logger
 
 logger = setup_logger(name="EdgarClient")
 
+# Matches the YYYY-MM-DD stamp in downloaded zip filenames
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Per Pool worker state set once by _init_facts_worker, so tasks only carry a filename. The facts zip is opened once
+# so its central directory is not re-read for every member (or points at the folder it was extracted to), and the
+# mappings are pickled once per worker.
+_FACTS_SOURCE: Union[zipfile.ZipFile, Path, None] = None
+_FACTS_ZIP_DATE: Optional[str] = None
+_TICKER_TO_CIK_MAPPING: Dict[str, str] = {}
+_CIK_TO_TICKER_MAPPING: Dict[str, str] = {}
+_FACTS_SAVE_FOLDER: Optional[Path] = None
+# Threads parsing the taxonomies of one member, created once per worker instead of once per member
+_TAXONOMY_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _init_facts_worker(file_path_to_zip: Path, extracted_folder: Optional[Path], date: str,
+                       ticker_to_cik_mapping: Dict[str, str], cik_to_ticker_mapping: Dict[str, str],
+                       facts_save_folder: Path) -> None:
+    global _FACTS_SOURCE, _FACTS_ZIP_DATE, _TICKER_TO_CIK_MAPPING, _CIK_TO_TICKER_MAPPING, _FACTS_SAVE_FOLDER, \
+        _TAXONOMY_EXECUTOR
+    _FACTS_SOURCE = extracted_folder if extracted_folder is not None else zipfile.ZipFile(file_path_to_zip, 'r')
+    _FACTS_ZIP_DATE = date
+    _TICKER_TO_CIK_MAPPING = ticker_to_cik_mapping
+    _CIK_TO_TICKER_MAPPING = cik_to_ticker_mapping
+    _FACTS_SAVE_FOLDER = facts_save_folder
+    _TAXONOMY_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+
+def _write_json(file_path: str, values: JSONType) -> None:
+    with open(file_path, 'wb') as outfile:
+        outfile.write(orjson.dumps(values))
+
+
+def _parse_taxonomy(args) -> Dict[Tuple[str, str, str, str], pd.Series]:
+    taxonomy_name, tags = args
+    columns = {}
+
+    logger.info(f'    Taxonomy {taxonomy_name}')
+    for tag_name, tag_dict in tags.items():
+        logger.info(f'      Tag {tag_name}')
+        for unit, facts in tag_dict["units"].items():
+            # Create a DataFrame from the data list
+            events_df = pd.DataFrame(facts)
+            logger.info(f'            Keys -> {list(events_df.keys())}')
+            # Key each column by its multi-index so the caller aligns every series in a single pass
+            for column in events_df.columns:
+                columns[(taxonomy_name, unit, tag_name, column)] = events_df[column]
+
+    return columns
+
+
+def _read_facts_member(facts_source: Union[zipfile.ZipFile, Path], filename: str) -> bytes:
+    if isinstance(facts_source, zipfile.ZipFile):
+        return facts_source.read(filename)
+    # Members already extracted from the zip are read straight from the filesystem
+    return (facts_source / filename).read_bytes()
+
+
+def _parse_facts_member(facts_source: Union[zipfile.ZipFile, Path], filename: str, date: str,
+                        ticker_to_cik_mapping: Dict[str, str], cik_to_ticker_mapping: Dict[str, str],
+                        facts_save_folder: Path, taxonomy_executor: Optional[ThreadPoolExecutor] = None) -> None:
+    """Parse one company facts member into a Parquet file.
+
+    Taxonomies are parsed on `taxonomy_executor` when given, else serially, e.g. when the caller already runs many
+    members on a thread pool.
+    """
+    try:
+        data = orjson.loads(_read_facts_member(facts_source, filename))
+        cik = validate_and_return_cik(data['cik'], ticker_to_cik_mapping, cik_to_ticker_mapping.keys())
+        ticker = cik_to_ticker_mapping[cik]
+        output_file_path = f'{facts_save_folder}/{ticker}_facts-{date}.parquet'
+        if os.path.exists(output_file_path):
+            logger.info(f'File already exists: {output_file_path}')
+            return
+        logger.info(f'Parsing {data["entityName"]} facts')
+        taxonomies = data['facts']
+
+        # Taxonomies are independent, and the per-tag work is mostly pandas C code, so threads suffice
+        columns = {}
+        parse_map = map if taxonomy_executor is None else taxonomy_executor.map
+        for taxonomy_columns in parse_map(_parse_taxonomy, taxonomies.items()):
+            columns.update(taxonomy_columns)
+        if not columns:
+            logger.warning(f'No facts found in {filename}')
+            return
+
+        # Build the frame from every series at once, one index union instead of a concat per frame
+        multi_df = pd.DataFrame(columns, columns=pd.MultiIndex.from_tuples(columns.keys()))
+        # Parquet needs flat string column names, so join the MultiIndex levels with '__'
+        multi_df.columns = ['__'.join(map(str, column)) for column in multi_df.columns]
+        multi_df.to_parquet(output_file_path, engine='pyarrow', compression='zstd')
+    except Exception as e:
+        logger.error(f'Error parsing {filename}: {e}')
+        return
+
 
 class SEC_Client(BaseClient, DownloadFormManager):
     """An :class:`EdgarClient` object.
 
     Header Defaults to the following:
         {
-            **STANDARD_HEADERS, # {"Accept-Encoding": "gzip, deflate", }
+            **STANDARD_HEADERS, # {"Accept-Encoding": "gzip, deflate, br", }
             "User-Agent": user_agent, # "<Sample Company Name> <Sample Company Email>"
             "Host": HOST_DATA_SEC, # "data.sec.gov"
         }
@@ -79,7 +182,64 @@ class SEC_Client(BaseClient, DownloadFormManager):
         self.facts_save_folder = self.parent_download_folder / ROOT_FACTS_SAVE_FOLDER_NAME
         self.forms_save_folder = self.parent_download_folder / ROOT_FORMS_SAVE_FOLDER_NAME
         self.ticker_to_cik_mapping, self.cik_to_ticker_mapping, self.cik_to_name = \
-            self.get_ticker_cik_name_mapping()
+            self._load_ticker_cik_name_mapping()
+        # Every known CIK, for constant time membership checks in validate_and_return_cik
+        self._cik_set = frozenset(self.ticker_to_cik_mapping.values())
+        # Ticker indexed CIK lookup used to resolve batches of tickers in a single vectorized pass
+        self.ticker_cik_series = pd.Series(self.ticker_to_cik_mapping, name='cik', dtype=object)
+
+        # Pooled keep-alive HTTP/2 client used by the RSS subscribers, concurrent feed polls are multiplexed over one
+        # TLS connection instead of paying a new handshake per poll. The Host header is derived from each feed URL.
+        # Redirects are followed like requests did, SEC answers the http:// feeds with a 301 to https://.
+        self._rss_client = httpx.Client(
+            headers={
+                "User-Agent": self.user_agent,
+                **STANDARD_HEADERS,
+            },
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=MAX_REQUESTS_PER_SECOND,
+                                    max_keepalive_connections=MAX_REQUESTS_PER_SECOND),
+            ),
+        )
+        finalize(self, self._rss_client.close)
+        # Cache validators per feed URL for conditional polling
+        self._rss_etag: Dict[str, str] = {}
+        self._rss_last_modified: Dict[str, str] = {}
+
+    def _load_ticker_cik_name_mapping(self) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+        """Get the ticker/CIK/name mappings from the on-disk cache, refetching them from SEC once the cache is
+        older than TICKER_CIK_CACHE_TTL_SECONDS."""
+        mapping_names = ['ticker_to_cik', 'cik_to_ticker', 'cik_to_name']
+        cache_path = self.parent_download_folder / TICKER_CIK_CACHE_FILENAME
+        try:
+            if time.time() - cache_path.stat().st_mtime < TICKER_CIK_CACHE_TTL_SECONDS:
+                cache_df = pd.read_parquet(cache_path)
+                return tuple(
+                    dict(zip(mapping_df['key'], mapping_df['value']))
+                    for mapping_df in (cache_df[cache_df['mapping'] == name] for name in mapping_names)
+                )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f'Could not read the ticker to cik cache {cache_path}, refetching: {e}')
+
+        mappings = self.get_ticker_cik_name_mapping()
+        try:
+            cache_df = pd.DataFrame(
+                [(name, key, value) for name, mapping in zip(mapping_names, mappings) for key, value in mapping.items()],
+                columns=['mapping', 'key', 'value'],
+            )
+            # Write to a temporary file first so a concurrent reader never sees a partially written cache
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_cache_path = cache_path.with_name(f'{cache_path.name}.tmp')
+            cache_df.to_parquet(tmp_cache_path, engine='pyarrow')
+            os.replace(tmp_cache_path, cache_path)
+        except Exception as e:
+            logger.warning(f'Could not write the ticker to cik cache {cache_path}: {e}')
+        return mappings
 
     def get_submissions_by_company(self, ticker_or_cik: str, *, handle_pagination: bool = True) -> JSONType:
         """Get submissions for a specified CIK. Requests data from the
@@ -98,9 +258,9 @@ class SEC_Client(BaseClient, DownloadFormManager):
         :return: JSON response from the data.sec.gov/submissions/ API endpoint
             for the specified CIK.
         """
-        cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping)
+        cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping, self._cik_set)
         submissions_uri = URL_SUBMISSIONS.format(cik=cik)
-        submissions = self._rate_limited_get(submissions_uri).json()
+        submissions = orjson.loads(self._rate_limited_get(submissions_uri).content)
         filings = submissions["filings"]
         paginated_submissions = filings["files"]
 
@@ -110,7 +270,7 @@ class SEC_Client(BaseClient, DownloadFormManager):
             for submission in paginated_submissions:
                 filename = submission["name"]
                 api_endpoint = URL_PAGINATED_SUBMISSIONS.format(paginated_file_name=filename)
-                resp = self._rate_limited_get(api_endpoint).json()
+                resp = orjson.loads(self._rate_limited_get(api_endpoint).content)
                 to_merge.append(resp)
 
             # Merge all paginated submissions from files key into recent
@@ -142,7 +302,7 @@ class SEC_Client(BaseClient, DownloadFormManager):
             API endpoint for the specified CIK.
         """
         return self._rate_limited_get(URL_XBRL_COMPANY_CONCEPTS.format(
-            cik=validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping),
+            cik=validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping, self._cik_set),
             taxonomy=taxonomy,
             tag=tag,
         )).json()
@@ -157,7 +317,7 @@ class SEC_Client(BaseClient, DownloadFormManager):
             API endpoint for the specified CIK.
         """
         return self._rate_limited_get(URL_XBRL_COMPANY_FACTS.format(
-            cik=validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping),
+            cik=validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping, self._cik_set),
         )).json()
 
     def get_frames(
@@ -206,6 +366,8 @@ class SEC_Client(BaseClient, DownloadFormManager):
             before: Optional[str] = None,
             include_amends: bool = False,
             download_details: bool = True,
+            advise_dontneed: bool = False,
+            sink: Literal['fs', 'tar'] = 'fs',
     ) -> int:
         """
         Fetches and saves SEC filings.
@@ -218,6 +380,8 @@ class SEC_Client(BaseClient, DownloadFormManager):
             before (Optional[str], default=None): The latest date for filings. If not specified, downloads filings up to today's date.
             include_amends (bool, default=False): Whether to include amended filings.
             download_details (bool, default=True): Whether to download filing details.
+            advise_dontneed (bool, default=False): Whether to drop written filings from the OS page cache (POSIX only).
+            sink (str, default='fs'): 'fs' saves one file per filing document, 'tar' saves one archive per form.
 
         Returns:
             int: The number of downloaded filings.
@@ -227,7 +391,7 @@ class SEC_Client(BaseClient, DownloadFormManager):
         """
         # TODO: add validation and defaulting
         # TODO: can we rely on class default values rather than manually checking None?
-        cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping)
+        cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping, self._cik_set)
         ticker = self.cik_to_ticker_mapping.get(cik, None)
 
         limit = sys.maxsize if limit is None else int(limit)
@@ -247,7 +411,7 @@ class SEC_Client(BaseClient, DownloadFormManager):
         num_downloaded = self.fetch_and_save_filings(
             FormsDownloadMetadata(
                 self.parent_download_folder,
-                form_types,  # pass the list of forms
+                tuple(form_types),
                 cik,
                 ticker,
                 limit,
@@ -255,45 +419,76 @@ class SEC_Client(BaseClient, DownloadFormManager):
                 before_date,
                 include_amends,
                 download_details,
+                advise_dontneed,
+                sink,
             ))
 
         return num_downloaded
 
+    def _batch_validate_ciks(self, tickers_or_ciks: List[str]) -> np.ndarray:
+        """Vectorized counterpart of `validate_and_return_cik` resolving a whole batch in one lookup.
+
+        Returns an object array aligned with the input holding the zero-padded CIK, or None where the ticker or
+        CIK could not be resolved.
+        """
+        keys = pd.Series(tickers_or_ciks, dtype=str).str.strip().str.upper()
+        is_cik = keys.str.fullmatch(r'\d{1,10}').to_numpy(dtype=bool)
+        padded_ciks = keys.str.zfill(CIK_LENGTH)
+        known_ciks = padded_ciks.isin(self.ticker_cik_series.to_numpy()).to_numpy()
+        ticker_ciks = self.ticker_cik_series.reindex(keys).to_numpy(dtype=object)
+
+        ciks = np.where(is_cik, np.where(known_ciks, padded_ciks.to_numpy(dtype=object), None), ticker_ciks)
+        return np.where(pd.isna(ciks), None, ciks)
+
     def download_facts_for_companies(self, tickers_or_ciks: List[str], skip_if_exists=True):
+        # Requests are RTT bound, so they run concurrently on an event loop
+        return run_coroutine_sync(lambda: self.adownload_facts_for_companies(tickers_or_ciks, skip_if_exists))
+
+    async def adownload_facts_for_companies(self, tickers_or_ciks: List[str], skip_if_exists=True):
+        """Async variant of `download_facts_for_companies`, for callers already running an event loop."""
         # todo can do this by downloading zip file and extracting them rather than looping through to download
         ticker_facts_saved = []
         ticker_facts_skipped = []
 
         self.facts_save_folder.mkdir(parents=True, exist_ok=True)
 
-        for ticker_or_cik in tickers_or_ciks:
-            try:
-                cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping)
-                ticker_name = self.cik_to_ticker_mapping.get(cik)
-                save_json_path = f'{self.facts_save_folder}/{ticker_name}-facts-{datetime.now().strftime("%Y-%m-%d")}.json'
-            except Exception as e:
-                logger.error(f"Skipping {ticker_or_cik} because of error: {e}")
+        to_fetch = []
+        for ticker_or_cik, cik in zip(tickers_or_ciks, self._batch_validate_ciks(tickers_or_ciks)):
+            if cik is None:
+                logger.error(f"Skipping {ticker_or_cik} because it cannot be mapped to a CIK")
                 ticker_facts_skipped.append(ticker_or_cik)
                 continue
+            ticker_name = self.cik_to_ticker_mapping.get(cik)
+            save_json_path = f'{self.facts_save_folder}/{ticker_name}-facts-{datetime.now().strftime("%Y-%m-%d")}.json'
             if skip_if_exists and os.path.exists(save_json_path):
                 logger.info(f"Skipping {ticker_name} because it already exists")
                 continue
+            to_fetch.append((ticker_name, cik, save_json_path))
+
+        # Concurrent requests share a single keep-alive client
+        semaphore = asyncio.Semaphore(MAX_REQUESTS_PER_SECOND)
+        async with self._async_client() as client:
+            results = await asyncio.gather(*[self._afetch_facts(client, semaphore, *args) for args in to_fetch])
+        for (ticker_name, _, _), saved in zip(to_fetch, results):
+            (ticker_facts_saved if saved else ticker_facts_skipped).append(ticker_name)
+        return ticker_facts_saved, ticker_facts_skipped
+
+    async def _afetch_facts(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                            ticker_name: str, cik: str, save_json_path: str) -> bool:
+        async with semaphore:
             try:
-                values = self.get_facts_by_company(ticker_name)
+                response = await self._async_rate_limited_get(client, URL_XBRL_COMPANY_FACTS.format(cik=cik))
+                values = orjson.loads(response.content)
             except Exception as e:
                 logger.error(f"Skipping {ticker_name}  while downloading facts because of error: {e}")
-                ticker_facts_skipped.append(ticker_name)
-                continue
-            try:
-                with open(save_json_path, 'w') as outfile:
-                    json.dump(values, outfile)
-                logger.info(f"Saved {ticker_name} facts")
-                ticker_facts_saved.append(ticker_name)
-            except Exception as e:
-                logger.error(f"Skipping {ticker_name}  while saving facts because of error: {e}")
-                ticker_facts_skipped.append(ticker_name)
-                continue
-        return ticker_facts_saved, ticker_facts_skipped
+                return False
+        try:
+            await asyncio.to_thread(_write_json, save_json_path, values)
+            logger.info(f"Saved {ticker_name} facts")
+            return True
+        except Exception as e:
+            logger.error(f"Skipping {ticker_name}  while saving facts because of error: {e}")
+            return False
 
     def download_forms_for_companies(self,
                                      tickers_or_ciks: List[str], form_types: List[str],
@@ -307,14 +502,12 @@ class SEC_Client(BaseClient, DownloadFormManager):
 
         forms_saved = []
         forms_skipped = []
-        for ticker_or_cik in tickers_or_ciks:
-            try:
-                cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping)
-                ticker_name = self.cik_to_ticker_mapping.get(cik)
-                logger.info(f"Downloading forms for {ticker_name}")
-            except Exception as e:
-                logger.error(f"Skipping {ticker_or_cik} because it is not in the ticker to cik mapping: {e}")
+        for ticker_or_cik, cik in zip(tickers_or_ciks, self._batch_validate_ciks(tickers_or_ciks)):
+            if cik is None:
+                logger.error(f"Skipping {ticker_or_cik} because it is not in the ticker to cik mapping")
                 continue
+            ticker_name = self.cik_to_ticker_mapping.get(cik)
+            logger.info(f"Downloading forms for {ticker_name}")
 
             unsupported_forms = [form for form in form_types if form not in self.supported_forms]
             if unsupported_forms:
@@ -336,6 +529,28 @@ class SEC_Client(BaseClient, DownloadFormManager):
                 continue
         return forms_saved, forms_skipped
 
+    def _rate_limited_rss_get(self, url: str) -> httpx.Response:
+        """Make a rate-limited conditional GET request through the pooled HTTP/2 RSS client.
+
+        The validators from the previous response of the same feed are sent back, so an unchanged feed is answered
+        with a body-less 304 Not Modified.
+        """
+        self._bucket.acquire()
+
+        headers = {}
+        if url in self._rss_etag:
+            headers["If-None-Match"] = self._rss_etag[url]
+        if url in self._rss_last_modified:
+            headers["If-Modified-Since"] = self._rss_last_modified[url]
+
+        response = self._rss_client.get(url, headers=headers)
+        if response.status_code != 304:
+            if "ETag" in response.headers:
+                self._rss_etag[url] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                self._rss_last_modified[url] = response.headers["Last-Modified"]
+        return response
+
     def subscribe_to_rss_feed(self, interval, callback_func=None):
         # todo if only_pass_entries_by_id is true the starting default value per id should also look back in the saved for the same id
         # todo allow to subscribe to specific form types or companies
@@ -354,15 +569,10 @@ class SEC_Client(BaseClient, DownloadFormManager):
         last_entry = None
         while True:
             try:
-
-                # fixme this is essensially the same as in baseclient except the host
-                response = requests.get(sec_rss_feed_url, headers={
-                    "User-Agent": self.user_agent,
-                    "Host": HOST_WWW_SEC,
-                    **STANDARD_HEADERS,
-                })
+                response = self._rate_limited_rss_get(sec_rss_feed_url)
+                if response.status_code == 304:  # Feed has not changed since the last poll
+                    continue
                 feed = feedparser.parse(response.content)
-                # fixme ^^^^
 
                 if not feed.entries:
                     logger.warning("No entries found in the RSS feed.")
@@ -394,33 +604,37 @@ class SEC_Client(BaseClient, DownloadFormManager):
 
         last_entries = {url: None for url in feed_urls}  # Store last entry for each feed
 
-        while True:
-            for url in feed_urls:
-                try:
-                    response = requests.get(url, headers={
-                        "User-Agent": self.user_agent,
-                        "Host": HOST_WWW_SEC,
-                        **STANDARD_HEADERS,
-                    })
-                    feed = feedparser.parse(response.content)
-
-                    if not feed.entries:
-                        logger.warning(f"No entries found in the RSS feed: {url}")
-                        continue
-
-                    new_entries = []
-                    for entry in feed.entries:
-                        if last_entries[url] is not None and entry.id == last_entries[url].id:
-                            break
-                        new_entries.append(entry)
-                    if new_entries:
-                        last_entries[url] = new_entries[0]  # Update the last entry
-                        for entry in new_entries:
-                            callback_func(entry)
-
-                except Exception as e:
-                    logger.error("Error:", e)
-            time.sleep(interval)
+        # Fetch every feed concurrently, the shared limiter keeps the pool under SEC's requests-per-second cap
+        self._rss_pool = ThreadPoolExecutor(max_workers=max(1, min(MAX_REQUESTS_PER_SECOND, len(feed_urls))))
+        try:
+            while True:
+                futures = {url: self._rss_pool.submit(self._rate_limited_rss_get, url) for url in feed_urls}
+                for url, future in futures.items():
+                    try:
+                        response = future.result()
+                        if response.status_code == 304:  # Feed has not changed since the last poll
+                            continue
+                        feed = feedparser.parse(response.content)
+
+                        if not feed.entries:
+                            logger.warning(f"No entries found in the RSS feed: {url}")
+                            continue
+
+                        new_entries = []
+                        for entry in feed.entries:
+                            if last_entries[url] is not None and entry.id == last_entries[url].id:
+                                break
+                            new_entries.append(entry)
+                        if new_entries:
+                            last_entries[url] = new_entries[0]  # Update the last entry
+                            for entry in new_entries:
+                                callback_func(entry)
+
+                    except Exception as e:
+                        logger.error("Error:", e)
+                time.sleep(interval)
+        finally:
+            self._rss_pool.shutdown(wait=False)
 
     def download_facts_of_all_companies_zip(self) -> str:
         """Download all company concepts for a specified CIK. Requests data from the
@@ -431,13 +645,15 @@ class SEC_Client(BaseClient, DownloadFormManager):
         :param save_path: The path to save the downloaded zip file.
         :return: The path of the downloaded zip file.
         """
-        response = self._rate_limited_get(URL_XBRL_COMPANY_FACTS_ZIP, host=HOST_WWW_SEC)
         self.facts_save_folder.mkdir(parents=True, exist_ok=True)
         file_path = os.path.join(self.facts_save_folder,
                                  f'all_companies_facts-{datetime.now().strftime("%Y-%m-%d")}.zip')
 
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the archive to disk rather than holding the multi-GB body in memory
+        with self._rate_limited_get(URL_XBRL_COMPANY_FACTS_ZIP, host=HOST_WWW_SEC, stream=True) as response, \
+                open(file_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=ZIP_DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
         return file_path
 
@@ -450,116 +666,131 @@ class SEC_Client(BaseClient, DownloadFormManager):
         :param save_path: The path to save the downloaded zip file.
         :return: The path of the downloaded zip file.
         """
-        response = self._rate_limited_get(URL_XBRL_COMPANY_SUBMISSIONS_ZIP, host=HOST_WWW_SEC)
         self.facts_save_folder.mkdir(parents=True, exist_ok=True)
 
         file_path = os.path.join(self.facts_save_folder,
                                  f'all_companies_submissions-{datetime.now().strftime("%Y-%m-%d")}.zip')
 
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the archive to disk rather than holding the multi-GB body in memory
+        with self._rate_limited_get(URL_XBRL_COMPANY_SUBMISSIONS_ZIP, host=HOST_WWW_SEC, stream=True) as response, \
+                open(file_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=ZIP_DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
         return file_path
 
     @staticmethod
-    def _parse_open_json(args):
-        filename, file_path_to_latest_zip, ticker_to_cik_mapping, cik_to_ticker_mapping, facts_save_folder = args
-        dataframes = []
-
-        with zipfile.ZipFile(file_path_to_latest_zip, 'r') as z:
-            with z.open(filename) as f:
-                try:
-                    data = json.load(f)
-                    cik = validate_and_return_cik(data['cik'], ticker_to_cik_mapping)
-                    ticker = cik_to_ticker_mapping[cik]
-                    date = re.search(r'\d{4}-\d{2}-\d{2}', file_path_to_latest_zip.name).group(0)
-                    output_file_path = f'{facts_save_folder}/{ticker}_facts-{date}.pkl'
-                    if os.path.exists(output_file_path):
-                        logger.info(f'File already exists: {output_file_path}')
-                        return
-                    logger.info(f'Parsing {data["entityName"]} facts')
-                    taxonomies = data['facts']
-
-                    for taxonomy_name in taxonomies.keys():
-                        logger.info(f'    Taxonomy {taxonomy_name}')
-                        for tag_name in taxonomies[taxonomy_name].keys():
-                            units = taxonomies[taxonomy_name][tag_name]["units"].keys()
-                            logger.info(f'      Tag {tag_name}')
-                            for unit in units:
-                                # Create a DataFrame from the data list
-                                events_df = pd.DataFrame(taxonomies[taxonomy_name][tag_name]["units"][unit])
-                                logger.info(f'            Keys -> {list(events_df.keys())}')
-                                # Add multi-index before concatenating to the main DataFrame
-                                events_df.columns = pd.MultiIndex.from_product(
-                                    [[taxonomy_name], [unit], [tag_name], events_df.columns])
-                                # Append the data to the dataframes list
-                                dataframes.append(events_df)
-
-                    # Concatenate all dataframes together
-                    multi_df = pd.concat(dataframes, axis=1)
-                    multi_df.to_pickle(output_file_path)
-                except Exception as e:
-                    logger.error(f'Error parsing {filename}: {e}')
-                    return
+    def _parse_open_json(filename):
+        # The zip handle (or extracted folder) is set once per worker by _init_facts_worker, only the member is read here
+        _parse_facts_member(_FACTS_SOURCE, filename, _FACTS_ZIP_DATE, _TICKER_TO_CIK_MAPPING, _CIK_TO_TICKER_MAPPING,
+                            _FACTS_SAVE_FOLDER, _TAXONOMY_EXECUTOR)
 
     @property
     def get_path_to_latest_facts_zip(self):
-        return max(self.facts_save_folder.glob('*.zip'), key=os.path.getctime)
+        # Single scandir pass, the DirEntry caches its stat so each zip is only stat'ed once
+        with os.scandir(self.facts_save_folder) as entries:
+            return Path(max((entry for entry in entries if entry.name.endswith('.zip')),
+                            key=lambda entry: entry.stat().st_ctime).path)
+
+    def parse_all_facts_in_latest_zip(self, number_of_cores=cpu_count() - 6, use_threads: bool = False,
+                                      extract_first: bool = False):
+        """Parse all facts from the downloaded zip file and store them in a database.
 
-    def parse_all_facts_in_latest_zip(self, number_of_cores=cpu_count() - 6):
-        """Parse all facts from the downloaded zip file and store them in a database."""
+        With ``use_threads`` the members are parsed by a thread pool sharing the already open zip handle, which
+        avoids the fork and pickling cost of the process pool at the price of contending for the GIL while parsing.
+
+        With ``extract_first`` the members are inflated once into a temporary directory (``tempfile.gettempdir()``,
+        ideally a tmpfs) and parsed from there, trading disk/RAM for repeated DEFLATE setup. Falls back to reading
+        from the zip when the temporary directory does not have room for the uncompressed members.
+        """
         file_path_to_latest_zip = self.get_path_to_latest_facts_zip
-        with zipfile.ZipFile(file_path_to_latest_zip, 'r') as z:
-            json_files = [(filename, file_path_to_latest_zip, self.ticker_to_cik_mapping, self.cik_to_ticker_mapping,
-                           self.facts_save_folder) for filename in z.namelist() if filename.endswith('.json')]
-            with Pool(number_of_cores) as p:
-                p.map(self._parse_open_json, json_files)
+        date = _DATE_RE.search(file_path_to_latest_zip.name).group(0)
+        # Tickers already parsed for this zip date are skipped here rather than after dispatching them to a worker
+        already_parsed = {path.name.split('_facts-')[0] for path in self.facts_save_folder.glob(f'*_facts-{date}.parquet')}
+        with zipfile.ZipFile(file_path_to_latest_zip, 'r') as z, ExitStack() as stack:
+            json_files = [filename for filename in z.namelist()
+                          if filename.endswith('.json')
+                          and self.cik_to_ticker_mapping.get(filename[len('CIK'):-len('.json')]) not in already_parsed]
+
+            extracted_folder = None
+            if extract_first:
+                uncompressed_size = sum(z.getinfo(filename).file_size for filename in json_files)
+                free_space = shutil.disk_usage(tempfile.gettempdir()).free
+                if uncompressed_size < free_space:
+                    extracted_folder = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix='sec-edgar-facts-')))
+                    logger.info(f'Extracting {len(json_files)} files to {extracted_folder}')
+                    z.extractall(extracted_folder, members=json_files)
+                else:
+                    logger.warning(f'Not enough space in {tempfile.gettempdir()} to extract {uncompressed_size} bytes '
+                                   f'({free_space} free), parsing from the zip instead')
+
+            if use_threads:
+                # Members already run concurrently here, so each parses its taxonomies serially
+                facts_source = extracted_folder if extracted_folder is not None else z
+                with ThreadPoolExecutor(number_of_cores) as executor:
+                    for _ in executor.map(lambda filename: _parse_facts_member(
+                            facts_source, filename, date, self.ticker_to_cik_mapping, self.cik_to_ticker_mapping,
+                            self.facts_save_folder), json_files):
+                        pass
+                return
+            with Pool(number_of_cores, initializer=_init_facts_worker,
+                      initargs=(file_path_to_latest_zip, extracted_folder, date, self.ticker_to_cik_mapping,
+                                self.cik_to_ticker_mapping, self.facts_save_folder)) as p:
+                # Stream tasks in chunks so fast files are not held behind slow ones and IPC is batched
+                for _ in p.imap_unordered(self._parse_open_json, json_files, chunksize=32):
+                    pass
 
     @staticmethod
-    def parse_facts_json(json_dict):
-        dataframes = []
+    def parse_facts_json(json_dict, tag_filter: Optional[Set[str]] = None):
+        """Parse a company facts JSON into a DataFrame with (taxonomy, tag, unit, field) MultiIndex columns.
 
+        :param tag_filter: only parse these tags, skipping the others before any frame is built.
+        """
         logger.info(f'Parsing {json_dict["entityName"]} facts')
         taxonomies = json_dict['facts']
         ALLOWED_DATA_COLUMNS = ['start', 'end', 'val', 'accn', 'fy', 'fp', 'form', 'filed', 'frame']
-        for taxonomy_name in taxonomies.keys():
-            for tag_name in taxonomies[taxonomy_name].keys():
-                units = taxonomies[taxonomy_name][tag_name]["units"].keys()
-
-                for unit in units:
-                    # Create a DataFrame from the data list
-                    events_df = pd.DataFrame(taxonomies[taxonomy_name][tag_name]["units"][unit])
-                    # events_df = events_df.dropna(axis=1, how='all')
-                    if not set(ALLOWED_DATA_COLUMNS).issubset(set(events_df.columns)):
-                        # Which columns are missing?
-                        missing_columns = set(ALLOWED_DATA_COLUMNS) - set(events_df.columns)
-
-                        # Make sure missing columns are only start and frame nothing else, else raise critical error
-                        # . missing_columns can be {'start'} or {'frame'} or {'start', 'frame'} or set()
-                        if not missing_columns.issubset({'start', 'frame'}):
-                            logger.critical(f'Columns {missing_columns} are missing from {tag_name}')
-                            exit()
-                        # Add the missing columns as missing nan columns
-                        for missing_column in missing_columns:
-                            events_df[missing_column] = np.nan
-
-                    # Add multi-index before concatenating to the main DataFrame
-                    events_df.columns = pd.MultiIndex.from_product(
-                        [[taxonomy_name], [tag_name], [unit], events_df.columns])
-
-                    # Append the data to the dataframes list
-                    dataframes.append(events_df)
-
-        # Concatenate all dataframes together
-        multi_df = pd.concat(dataframes, axis=1)
-        return multi_df.sort_index()
-
-    def query_fact_from_zip(self, ticker_or_cik: str,
-                            # tag: str = None, dates: List[str] = None,
-                            return_raw_json=False):
+
+        # Flatten every fact into a single record list keyed by (taxonomy, tag, unit, position) so the frame is
+        # built once instead of one DataFrame per unit followed by a wide concat
+        keys = []
+        records = []
+        for taxonomy_name, tags in taxonomies.items():
+            for tag_name, tag_dict in tags.items():
+                if tag_filter and tag_name not in tag_filter:
+                    continue
+                for unit, facts in tag_dict["units"].items():
+                    # Make sure missing columns are only start and frame nothing else, else raise critical error
+                    missing_columns = set(ALLOWED_DATA_COLUMNS).difference(*facts)
+                    if not missing_columns.issubset({'start', 'frame'}):
+                        logger.critical(f'Columns {missing_columns} are missing from {tag_name}')
+                        exit()
+                    keys.extend((taxonomy_name, tag_name, unit, position) for position in range(len(facts)))
+                    records.extend(facts)
+
+        if not records:
+            logger.warning(f'No facts found for {json_dict["entityName"]}')
+            return pd.DataFrame()
+
+        # Declaring the full schema up front lets pandas allocate every column in one shot, keys absent from a fact
+        # (typically start and frame) come out as NA without patching columns in afterwards. The frame stays object
+        # dtype until every unit has its own column, so a unit's integers never pass through a float column shared
+        # with other units.
+        facts_df = pd.DataFrame(records, columns=ALLOWED_DATA_COLUMNS, dtype=object)
+
+        # Pivot the (taxonomy, tag, unit) keys into the columns, their facts line up by position on the rows
+        facts_df.index = pd.MultiIndex.from_tuples(keys, names=['taxonomy', 'tag', 'unit', 'position'])
+        multi_df = facts_df.unstack(['taxonomy', 'tag', 'unit']).reorder_levels([1, 2, 3, 0], axis=1)
+        # Infer each column's dtype on its own, like the per unit frames did: integer columns stay int64 unless
+        # padded with NA by a longer unit
+        multi_df = multi_df.infer_objects()
+        multi_df.columns.names = [None] * multi_df.columns.nlevels
+        multi_df.index.name = None
+        return multi_df.sort_index(axis=1)
+
+    def query_fact_from_zip(self, ticker_or_cik: str, tag: Optional[str] = None, return_raw_json=False):
 
         # Validate the ticker or CIK to CIK
-        cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping)
+        cik = validate_and_return_cik(ticker_or_cik, self.ticker_to_cik_mapping, self._cik_set)
         ticker_name = self.cik_to_ticker_mapping.get(cik)
 
         # Construct the filename of the json file
@@ -567,32 +798,25 @@ class SEC_Client(BaseClient, DownloadFormManager):
 
         # Get the path to the latest zip file downloaded
         file_path_to_latest_zip = self.get_path_to_latest_facts_zip
-        updated_date = re.search(r'\d{4}-\d{2}-\d{2}', file_path_to_latest_zip.name).group(0)
+        updated_date = _DATE_RE.search(file_path_to_latest_zip.name).group(0)
         logger.info(f'Latest zip file found: {file_path_to_latest_zip.name} with updated date {updated_date}')
 
         # Go inside the zip file
         with zipfile.ZipFile(file_path_to_latest_zip, 'r') as z:
             # Checking if the file exists in the zip file
-            if filename not in z.namelist():
+            try:
+                raw_json = z.read(filename)
+            except KeyError:
                 logger.error(f'File {filename} not found in the zip file')
                 return
 
-            # Get the list of files in the zip file
-            with z.open(filename) as f:
-                json_dict = json.load(f)
-                if return_raw_json:
-                    return json_dict
-                multiindex_df = self.parse_facts_json(json_dict)
-
-
-            print(multiindex_df[('us-gaap', 'NetIncomeLoss', 'USD')])
-
-            exit()
-
-            # TODO Lets query the data
-            # logger.info(f'Querying {ticker_name} facts in {filename}')
+        json_dict = orjson.loads(raw_json)
+        if return_raw_json:
+            return json_dict
 
-            return multiindex_df
+        logger.info(f'Querying {ticker_name} facts in {filename}')
+        # Only the requested tag is turned into a frame
+        return self.parse_facts_json(json_dict, tag_filter={tag} if tag is not None else None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+import httpx
+
+from EdgarAPIError import EdgarAPIError
+from _BaseClient import retries
+from _TokenBucket import sec_rate_limiter
+from _constants import BACKOFF_FACTOR, HOST_DATA_SEC, HTTP_POOL_MAXSIZE, MAX_DOWNLOAD_WORKERS, MAX_RETRIES, \
+    STANDARD_HEADERS
+from logger import setup_logger
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+
+def run_coroutine_sync(make_coroutine: Callable[[], Awaitable[T]]) -> T:
+    """Run a coroutine to completion from sync code, also when called inside a running event loop (e.g. Jupyter).
+
+    asyncio.run cannot nest, so with a loop already running the coroutine gets its own loop on a worker thread. The
+    coroutine is only created once it is about to run, so none is left un-awaited.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(make_coroutine())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(make_coroutine())).result()
+
+
+class AsyncBaseClient:
+    """Asyncio counterpart of :class:`BaseClient`.
+
+    Requests share the process-wide token bucket with the sync client, so mixing both stays within SEC's limit.
+    An ``httpx.AsyncClient`` is bound to the event loop it was created on, so one is opened per top-level call via
+    :meth:`_async_client` and handed to :meth:`_async_rate_limited_get`.
+
+    The only instance state is ``user_agent``, which every client sets, so subclasses whose MRO skips this
+    ``__init__`` (SEC_Client) still work.
+    """
+    _bucket = sec_rate_limiter
+
+    def __init__(self, user_agent: str):
+        self.user_agent = user_agent
+
+    @property
+    def _async_headers(self) -> dict:
+        return {
+            **STANDARD_HEADERS,
+            "User-Agent": self.user_agent,
+            "Host": HOST_DATA_SEC,
+        }
+
+    @asynccontextmanager
+    async def _async_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        limits = httpx.Limits(max_connections=HTTP_POOL_MAXSIZE, max_keepalive_connections=MAX_DOWNLOAD_WORKERS)
+        transport = httpx.AsyncHTTPTransport(retries=MAX_RETRIES, limits=limits)
+        async with httpx.AsyncClient(headers=self._async_headers, transport=transport) as client:
+            yield client
+
+    async def _async_rate_limited_send(self, client: httpx.AsyncClient, url: str, host=None,
+                                       stream: bool = False) -> httpx.Response:
+        """Make a rate-limited GET request without blocking the event loop.
+
+        SEC limits users to a maximum of 10 requests per second.
+        Source: https://www.sec.gov/developer
+
+        Statuses in the sync client's retry policy are retried with the same backoff, each attempt takes a token.
+        """
+        headers = {"Host": host} if host is not None else None
+        request = client.build_request("GET", url, headers=headers)
+        for attempt in range(MAX_RETRIES + 1):
+            await asyncio.sleep(self._bucket.reserve())
+            resp = await client.send(request, stream=stream)
+            if resp.status_code not in retries.status_forcelist or attempt == MAX_RETRIES:
+                break
+            await resp.aclose()
+            await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            # A streamed body is never read on error, close it so its connection goes back to the pool
+            await resp.aclose()
+            raise EdgarAPIError(
+                exception=e,
+                status_code=resp.status_code,
+                url=str(resp.url),
+            )
+        return resp
+
+    async def _async_rate_limited_get(self, client: httpx.AsyncClient, url: str, host=None) -> httpx.Response:
+        """Rate-limited GET reading the whole body, see `_async_rate_limited_send`."""
+        return await self._async_rate_limited_send(client, url, host=host)
+
+    @asynccontextmanager
+    async def _async_rate_limited_stream(self, client: httpx.AsyncClient, url: str,
+                                         host=None) -> AsyncIterator[httpx.Response]:
+        """Rate-limited GET whose body is consumed with ``aiter_bytes``, see `_async_rate_limited_send`."""
+        resp = await self._async_rate_limited_send(client, url, host=host, stream=True)
+        try:
+            yield resp
+        finally:
+            await resp.aclose()
@@ -1,21 +1,18 @@
 from weakref import finalize
 
 import requests
-from pyrate_limiter import Duration, Limiter, RequestRate
 from requests import Response
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from EdgarAPIError import EdgarAPIError
-from _constants import BACKOFF_FACTOR, MAX_REQUESTS_PER_SECOND, MAX_RETRIES, HOST_DATA_SEC, STANDARD_HEADERS
+from _TokenBucket import sec_rate_limiter
+from _constants import BACKOFF_FACTOR, MAX_RETRIES, HOST_DATA_SEC, STANDARD_HEADERS, \
+    HTTP_POOL_MAXSIZE
 from logger import setup_logger
 
 logger = setup_logger(__name__)
 
-# Rate limiter
-rate = RequestRate(MAX_REQUESTS_PER_SECOND, Duration.SECOND)
-limiter = Limiter(rate)
-
 # Specify max number of request retries
 # https://stackoverflow.com/a/35504626/3820660
 retries = Retry(
@@ -28,6 +25,8 @@ retries = Retry(
 class BaseClient:
     def __init__(self, user_agent: str):
 
+        self._bucket = sec_rate_limiter
+
         self._session = requests.Session()
         self._session.headers.update(
             {
@@ -38,22 +37,28 @@ class BaseClient:
         )
         logger.debug(f'{self._session.headers = }')
 
-        self._session.mount("http://", HTTPAdapter(max_retries=retries))
-        self._session.mount("https://", HTTPAdapter(max_retries=retries))
+        # One adapter for both schemes, sized above the download thread pool so keep-alive connections to
+        # data.sec.gov and www.sec.gov are reused instead of discarded
+        adapter = HTTPAdapter(max_retries=retries, pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE,
+                              pool_block=False)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
         # Close the session when this object is garbage collected
         # or the program exits.
         # Source: https://stackoverflow.com/a/67312839/3820660
         finalize(self, self._session.close)
 
-    # @limiter.ratelimit("sec_global_rate_limit",delay=True)
-    @limiter.ratelimit(delay=True)
-    def _rate_limited_get(self, url: str, headers: dict = None, host=None) -> Response:
+    def _rate_limited_get(self, url: str, headers: dict = None, host=None, stream: bool = False) -> Response:
         """Make a rate-limited GET request.
 
         SEC limits users to a maximum of 10 requests per second.
         Source: https://www.sec.gov/developer
+
+        Pass ``stream=True`` to defer downloading the body, it can then be consumed with ``iter_content``.
         """
+        self._bucket.acquire()
+
         # Merge session headers with provided headers, if any
         session_headers_copy = self._session.headers.copy()
         if headers is not None:
@@ -61,10 +66,12 @@ class BaseClient:
         elif host is not None:
             session_headers_copy.update({"Host": host})
 
-        resp = self._session.get(url, headers=session_headers_copy)
+        resp = self._session.get(url, headers=session_headers_copy, stream=stream)
         try:
             resp.raise_for_status()
         except requests.exceptions.RequestException as e:
+            # A streamed body is never read on error, close it so its connection goes back to the pool
+            resp.close()
             raise EdgarAPIError(
                 exception=e,
                 status_code=resp.status_code,
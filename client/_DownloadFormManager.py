@@ -1,25 +1,40 @@
+import asyncio
+import os
+import tarfile
+import threading
+import time
 from collections import deque
+from contextlib import nullcontext
+from datetime import date
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import AsyncIterator, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+import httpx
+import orjson
 import pandas as pd
 
 from Modules.EDGAR.client._BaseClient import BaseClient
+from _AsyncBaseClient import AsyncBaseClient, run_coroutine_sync
 from Modules.EDGAR.client.logger import setup_logger
 from _constants import (
     AMENDS_SUFFIX,
     CIK_LENGTH,
+    FORM_DOWNLOAD_CHUNK_SIZE,
+    MAX_DOWNLOAD_WORKERS,
     PRIMARY_DOC_FILENAME_STEM,
     ROOT_FORMS_SAVE_FOLDER_NAME,
-    URL_FILING,
+    URL_FILINGS_ROOT,
     URL_SUBMISSIONS, FORM_FULL_SUBMISSION_FILENAME, HOST_WWW_SEC, URL_CIK_MAPPING,
-    URL_PAGINATED_SUBMISSIONS,
+    URL_PAGINATED_SUBMISSIONS, TICKER_CIK_CACHE_TTL_SECONDS,
 )
-from _types import FormsDownloadMetadata, FormToDownload
-from _utils import within_requested_date_range
+from _types import FormsDownloadMetadata, FormToDownload, JSONType, SubmissionsType
 
 logger = setup_logger(__name__)
 
+# Folders already created by save_form_document in this process
+_created_folders = set()
+
 
 def get_forms_save_location(download_metadata: FormsDownloadMetadata,
                             form: str,
@@ -36,7 +51,7 @@ def get_forms_save_location(download_metadata: FormsDownloadMetadata,
     )
 
 
-def save_form_document(filing_contents: Any,
+def save_form_document(filing_contents: Union[bytes, Iterable[bytes]],
                        download_metadata: FormsDownloadMetadata,
                        form_meta_data: FormToDownload,
                        save_filename: str,
@@ -44,36 +59,265 @@ def save_form_document(filing_contents: Any,
     # Create all parent directories as needed and write content to file
     save_path = get_forms_save_location(download_metadata, form_meta_data.form, form_meta_data.accession_number,
                                         save_filename)
-    save_path.parent.mkdir(parents=True, exist_ok=True)
+    parent = save_path.parent
+    # Most filings share their parent folders, so each one is only created once per process
+    if parent not in _created_folders:
+        parent.mkdir(parents=True, exist_ok=True)
+        _created_folders.add(parent)
     # TODO: resolve URLs so that images show up in HTML files?
-    save_path.write_bytes(filing_contents)
+    if isinstance(filing_contents, bytes):
+        filing_contents = (filing_contents,)
+    # Write to a partial file and rename it once complete, so an interrupted stream is never mistaken for a
+    # finished download
+    partial_path = save_path.with_name(f"{save_path.name}.part")
+    if download_metadata.advise_dontneed and hasattr(os, 'posix_fadvise'):
+        _write_and_drop_from_page_cache(partial_path, filing_contents)
+    else:
+        with open(partial_path, 'wb', buffering=FORM_DOWNLOAD_CHUNK_SIZE) as f:
+            for chunk in filing_contents:
+                f.write(chunk)
+    os.replace(partial_path, save_path)
+
+
+def _write_and_drop_from_page_cache(path: Path, filing_contents: Iterable[bytes]) -> None:
+    """Write unbuffered, then hint the kernel to evict the file so long batch runs keep the page cache useful."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for chunk in filing_contents:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+        # Only clean pages can be dropped, so flush them first
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+async def _anext(chunks: AsyncIterator[bytes]) -> bytes:
+    return await chunks.__anext__()
+
+
+def _iterate_from_thread(chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop) -> Iterator[bytes]:
+    """Iterate an async iterator running on `loop` from a worker thread, so blocking writers can consume it."""
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(_anext(chunks), loop).result()
+        except StopAsyncIteration:
+            return
+
+
+def get_forms_archive_location(download_metadata: FormsDownloadMetadata, form: str) -> Path:
+    # Forms such as "10-K/A" contain a slash, which is not allowed in a file name
+    return (
+            download_metadata.download_folder
+            / ROOT_FORMS_SAVE_FOLDER_NAME
+            / f'{download_metadata.ticker}-{download_metadata.cik}'
+            / f'{form.replace("/", "_")}.tar'
+    )
+
+
+class _TarArchive:
+    """An open form archive with its member names, shared by every sink writing to the same path."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.users = 0
+        self._tar: Optional[tarfile.TarFile] = None
+        self._member_names: Set[str] = set()
+
+    def _open(self) -> tarfile.TarFile:
+        # Called with the lock held, the archive is only opened once it is first used
+        if self._tar is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Append mode creates the archive if needed and otherwise writes after its existing members
+            self._tar = tarfile.open(self.path, mode='a')
+            self._member_names = set(self._tar.getnames())
+        return self._tar
+
+    def has_members(self, names: List[str]) -> bool:
+        with self.lock:
+            self._open()
+            return all(name in self._member_names for name in names)
+
+    def add_members(self, members: List[Tuple[str, bytes]]) -> None:
+        mtime = int(time.time())
+        with self.lock:
+            tar = self._open()
+            for name, data in members:
+                if name in self._member_names:
+                    continue
+                tarinfo = tarfile.TarInfo(name=name)
+                tarinfo.size = len(data)
+                tarinfo.mtime = mtime
+                tar.addfile(tarinfo, BytesIO(data))
+                self._member_names.add(name)
+            tar.fileobj.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if self._tar is not None:
+                self._tar.close()
+                self._tar = None
+
+
+# Archives in use by any TarFormSink of this process keyed by resolved path, so sinks for the same company and form
+# (e.g. two download requests downloaded concurrently) append through one handle instead of corrupting the file
+_open_tar_archives: Dict[Path, _TarArchive] = {}
+_open_tar_archives_lock = threading.Lock()
+
+
+def _acquire_tar_archive(path: Path) -> _TarArchive:
+    path = path.resolve()
+    with _open_tar_archives_lock:
+        archive = _open_tar_archives.get(path)
+        if archive is None:
+            archive = _open_tar_archives[path] = _TarArchive(path)
+        archive.users += 1
+        return archive
+
+
+def _release_tar_archive(archive: _TarArchive) -> None:
+    with _open_tar_archives_lock:
+        archive.users -= 1
+        if archive.users == 0:
+            # Closed under the registry lock, so the path is not reopened before the end of archive is written
+            del _open_tar_archives[archive.path]
+            archive.close()
+
+
+class TarFormSink:
+    """Write filing documents into one tar archive per form instead of one file per accession.
+
+    Members are named `{accession_number}/{save_filename}`. Archives are appended to, so filings saved by earlier runs
+    are kept and skipped. Writes are serialized per archive across every sink of the process, so sinks can be used
+    by concurrent downloads.
+    """
+
+    def __init__(self, download_metadata: FormsDownloadMetadata):
+        self.download_metadata = download_metadata
+        self._archives: Dict[str, _TarArchive] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "TarFormSink":
+        return self
 
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
-def get_to_download(cik: str, acc_num: str, form: str, doc: str) -> FormToDownload:
-    cik = cik.strip("0")
+    def is_already_downloaded(self, form_meta_data: FormToDownload) -> bool:
+        save_filenames = [FORM_FULL_SUBMISSION_FILENAME]
+        if self.download_metadata.download_details:
+            save_filenames.append(f"{PRIMARY_DOC_FILENAME_STEM}{form_meta_data.details_doc_suffix}")
+        return self._get_archive(form_meta_data.form).has_members(
+            [f"{form_meta_data.accession_number}/{save_filename}" for save_filename in save_filenames])
+
+    def write(self, form_meta_data: FormToDownload, documents: List[Tuple[str, bytes]]) -> None:
+        """Append all `(save_filename, data)` documents of one filing, so a filing is never half archived."""
+        self._get_archive(form_meta_data.form).add_members(
+            [(f"{form_meta_data.accession_number}/{save_filename}", data) for save_filename, data in documents])
+
+    def _get_archive(self, form: str) -> _TarArchive:
+        with self._lock:
+            archive = self._archives.get(form)
+            if archive is None:
+                archive = self._archives[form] = _acquire_tar_archive(
+                    get_forms_archive_location(self.download_metadata, form))
+            return archive
+
+    def close(self) -> None:
+        with self._lock:
+            for archive in self._archives.values():
+                _release_tar_archive(archive)
+            self._archives.clear()
+
+
+def get_to_download(stripped_cik: str, acc_num: str, form: str, doc: str) -> FormToDownload:
+    # `stripped_cik` is the CIK without its leading zeros, hoisted by the caller since it is the same for every filing
     acc_num_no_dash = acc_num.replace("-", "")
-    raw_filing_uri = URL_FILING.format(cik=cik, acc_num_no_dash=acc_num_no_dash, document=f"{acc_num}.txt")
-    primary_doc_uri = URL_FILING.format(cik=cik, acc_num_no_dash=acc_num_no_dash, document=doc)
-    primary_doc_suffix = Path(doc).suffix.replace("htm", "html")
+    filing_prefix = f"{URL_FILINGS_ROOT}/{stripped_cik}/{acc_num_no_dash}"
+    raw_filing_uri = f"{filing_prefix}/{acc_num}.txt"
+    primary_doc_uri = f"{filing_prefix}/{doc}"
+    _, dot, ext = doc.rpartition(".")
+    primary_doc_suffix = (".html" if ext == "htm" else f".{ext}") if dot else ""
     return FormToDownload(form, raw_filing_uri, primary_doc_uri, acc_num, primary_doc_suffix)
 
 
-class DownloadFormManager(BaseClient):
+def select_filings_to_download(filings_json: SubmissionsType,
+                               download_metadata: FormsDownloadMetadata,
+                               forms_set: FrozenSet[str],
+                               max_filings: int,
+                               ) -> List[FormToDownload]:
+    """Select up to `max_filings` filings of one submissions page matching the requested forms and dates."""
+    selected: List[FormToDownload] = []
+    # Hoisted out of the per-filing loop below
+    after, before = download_metadata.after, download_metadata.before
+    include_amends = download_metadata.include_amends
+    stripped_cik = download_metadata.cik.lstrip("0")
+
+    for acc_num, form, doc, f_date in zip(filings_json["accessionNumber"], filings_json["form"],
+                                          filings_json["primaryDocument"], filings_json["filingDate"], strict=True):
+        if form not in forms_set or (not include_amends and form.endswith(AMENDS_SUFFIX)):
+            continue
+        if not after <= date.fromisoformat(f_date) <= before:
+            continue
+        selected.append(get_to_download(stripped_cik, acc_num, form, doc))
+        # We have reached the requested download limit, so exit early
+        if len(selected) == max_filings: break
+    return selected
+
+
+def next_submissions_page(filings_json: SubmissionsType, additional_submissions: deque, after: date) -> Optional[str]:
+    """Pop the name of the next paginated submissions file worth fetching, or None if no older page can match.
+
+    Filings are returned newest-first, so once the current page reaches back before `after` every further page is
+    out of range as well. Pages whose `filingTo` is before `after` are dropped without being fetched.
+    """
+    filing_dates = filings_json["filingDate"]
+    if filing_dates and date.fromisoformat(filing_dates[-1]) < after:
+        return None
+    while additional_submissions:
+        entry = additional_submissions.popleft()
+        if date.fromisoformat(entry["filingTo"]) < after:
+            continue
+        return entry["name"]
+    return None
+
+
+class DownloadFormManager(BaseClient, AsyncBaseClient):
+    # Raw company tickers payload, shared by the ticker lookups and refreshed after TICKER_CIK_CACHE_TTL_SECONDS.
+    # Class level defaults so subclasses whose MRO skips this __init__ (SEC_Client) still have them.
+    _ticker_cache = None
+    _ticker_cache_ts = 0.0
+
     def __init__(self, user_agent: str):
         super().__init__(user_agent)
+        AsyncBaseClient.__init__(self, user_agent)
         self.user_agent = user_agent
 
     def aggregate_forms_to_download(self,
                                     download_metadata: FormsDownloadMetadata
                                     ) -> List[FormToDownload]:
+        """Sync wrapper of `aaggregate_forms_to_download`."""
+
+        async def aggregate() -> List[FormToDownload]:
+            async with self._async_client() as client:
+                return await self.aaggregate_forms_to_download(client, download_metadata)
+
+        return run_coroutine_sync(aggregate)
+
+    async def aaggregate_forms_to_download(self,
+                                           client: httpx.AsyncClient,
+                                           download_metadata: FormsDownloadMetadata
+                                           ) -> List[FormToDownload]:
         filings_to_download: List[FormToDownload] = []
-        fetched_count = 0
-        filings_available = True
         submissions_uri = URL_SUBMISSIONS.format(cik=download_metadata.cik)
         additional_submissions = None
+        forms_set = frozenset(download_metadata.forms)
 
-        while fetched_count < download_metadata.limit and filings_available:
-            resp_json = self._rate_limited_get(submissions_uri).json()
+        while len(filings_to_download) < download_metadata.limit:
+            resp_json = orjson.loads((await self._async_rate_limited_get(client, submissions_uri)).content)
             # First API response is different from further API responses
             if additional_submissions is None:
                 filings_json = resp_json["filings"]["recent"]
@@ -81,48 +325,125 @@ class DownloadFormManager(BaseClient):
             # On second page or more of API response (for companies with >1000 filings)
             else:
                 filings_json = resp_json
-            accession_numbers = filings_json["accessionNumber"]
-            forms = filings_json["form"]
+            filings_to_download.extend(select_filings_to_download(
+                filings_json, download_metadata, forms_set, download_metadata.limit - len(filings_to_download)))
 
-            documents = filings_json["primaryDocument"]
-            filing_dates = filings_json["filingDate"]
-
-            for acc_num, form, doc, f_date in zip(accession_numbers, forms, documents, filing_dates, strict=True):
-                if (form not in download_metadata.forms or  # Change this to `not in`
-                        (not download_metadata.include_amends and form.endswith(AMENDS_SUFFIX)) or
-                        not within_requested_date_range(download_metadata, f_date)):
-                    continue
-                filings_to_download.append(get_to_download(download_metadata.cik, acc_num, form, doc))
-
-                fetched_count += 1
-                # We have reached the requested download limit, so exit early
-                if fetched_count == download_metadata.limit: return filings_to_download
-
-            if len(additional_submissions) == 0: break
-            next_page = additional_submissions.popleft()["name"]
+            next_page = next_submissions_page(filings_json, additional_submissions, download_metadata.after)
+            if next_page is None: break
             submissions_uri = URL_PAGINATED_SUBMISSIONS.format(paginated_file_name=next_page)
         return filings_to_download
 
+    @staticmethod
+    def _is_already_downloaded(download_metadata: FormsDownloadMetadata, td: FormToDownload,
+                               tar_sink: Optional[TarFormSink] = None) -> bool:
+        if tar_sink is not None:
+            return tar_sink.is_already_downloaded(td)
+        raw_path = get_forms_save_location(download_metadata, td.form, td.accession_number,
+                                           FORM_FULL_SUBMISSION_FILENAME)
+        if not raw_path.exists() or raw_path.stat().st_size == 0:
+            return False
+        if not download_metadata.download_details:
+            return True
+        primary_path = get_forms_save_location(download_metadata, td.form, td.accession_number,
+                                               f"{PRIMARY_DOC_FILENAME_STEM}{td.details_doc_suffix}")
+        return primary_path.exists() and primary_path.stat().st_size > 0
+
     def fetch_and_save_filings(self, download_metadata: FormsDownloadMetadata) -> int:
-        # TODO: do not download files that already exist
-        # TODO: add try/except around failed downloads and continue
+        """Sync wrapper of `afetch_and_save_filings`, returning the number of downloaded filings."""
         # todo i can probably split this into fetching raw data and/or html to serve for example and the actual writing to file in case we do not want to save
-        successfully_downloaded = 0
-        to_download = self.aggregate_forms_to_download(download_metadata)
-        for td in to_download:
-            logger.info(f"Downloading {td.form} for {download_metadata.ticker} on {td.accession_number}")
-            raw_filing = self._rate_limited_get(td.raw_filing_uri, host=HOST_WWW_SEC).content
-            save_form_document(raw_filing, download_metadata, td, FORM_FULL_SUBMISSION_FILENAME)
+
+        async def fetch() -> int:
+            async with self._async_client() as client:
+                return await self.afetch_and_save_filings(client, download_metadata,
+                                                          asyncio.Semaphore(MAX_DOWNLOAD_WORKERS))
+
+        return run_coroutine_sync(fetch)
+
+    def _get_ticker_metadata(self) -> JSONType:
+        """Get the raw company tickers payload, fetching it from SEC at most once per cache TTL."""
+        if self._ticker_cache is None or time.time() - self._ticker_cache_ts >= TICKER_CIK_CACHE_TTL_SECONDS:
+            self._ticker_cache = orjson.loads(self._rate_limited_get(URL_CIK_MAPPING, host=HOST_WWW_SEC).content)
+            self._ticker_cache_ts = time.time()
+        return self._ticker_cache
+
+    async def _astream_form_document(self, client: httpx.AsyncClient, uri: str,
+                                     download_metadata: FormsDownloadMetadata, td: FormToDownload,
+                                     save_filename: str) -> None:
+        # Stream bodies straight to disk, filings with exhibits can be tens of MB. The blocking writes run on a worker
+        # thread that pulls each chunk from the event loop.
+        loop = asyncio.get_running_loop()
+        async with self._async_rate_limited_stream(client, uri, host=HOST_WWW_SEC) as resp:
+            chunks = _iterate_from_thread(resp.aiter_bytes(FORM_DOWNLOAD_CHUNK_SIZE), loop)
+            await asyncio.to_thread(save_form_document, chunks, download_metadata, td, save_filename)
+
+    async def _adownload_filing(self, client: httpx.AsyncClient, download_metadata: FormsDownloadMetadata,
+                                td: FormToDownload, tar_sink: Optional[TarFormSink] = None) -> None:
+        logger.info(f"Downloading {td.form} for {download_metadata.ticker} on {td.accession_number}")
+        primary_doc_filename = f"{PRIMARY_DOC_FILENAME_STEM}{td.details_doc_suffix}"
+        if tar_sink is not None:
+            # Tar members need their size up front, so bodies are buffered rather than streamed. Every document is
+            # fetched before any is written, so a failed filing leaves nothing in the archive.
+            documents = [(FORM_FULL_SUBMISSION_FILENAME,
+                          (await self._async_rate_limited_get(client, td.raw_filing_uri, host=HOST_WWW_SEC)).content)]
             if download_metadata.download_details:
-                primary_doc = self._rate_limited_get(td.primary_doc_uri, host=HOST_WWW_SEC).content
-                primary_doc_filename = f"{PRIMARY_DOC_FILENAME_STEM}{td.details_doc_suffix}"
-                save_form_document(primary_doc, download_metadata, td, primary_doc_filename)
-            successfully_downloaded += 1
-        return successfully_downloaded
+                documents.append((primary_doc_filename, (await self._async_rate_limited_get(
+                    client, td.primary_doc_uri, host=HOST_WWW_SEC)).content))
+            await asyncio.to_thread(tar_sink.write, td, documents)
+            return
+        await self._astream_form_document(client, td.raw_filing_uri, download_metadata, td,
+                                          FORM_FULL_SUBMISSION_FILENAME)
+        if download_metadata.download_details:
+            await self._astream_form_document(client, td.primary_doc_uri, download_metadata, td, primary_doc_filename)
+
+    async def afetch_and_save_filings(self, client: httpx.AsyncClient, download_metadata: FormsDownloadMetadata,
+                                      semaphore: asyncio.Semaphore) -> int:
+        """Fetch and save the filings of `download_metadata`, at most `semaphore` filings are in flight at once.
+
+        Filings are downloaded concurrently, the shared rate limiter spaces out their requests so together they stay
+        within SEC's requests-per-second cap rather than each waiting on its own round trip.
+        """
+        to_download = await self.aaggregate_forms_to_download(client, download_metadata)
+
+        async def download_one(td: FormToDownload, tar_sink: Optional[TarFormSink]) -> bool:
+            async with semaphore:
+                try:
+                    await self._adownload_filing(client, download_metadata, td, tar_sink)
+                    return True
+                except Exception as e:
+                    logger.error(f"Failed to download {td.form} for {download_metadata.ticker} on "
+                                 f"{td.accession_number}: {e}")
+                    return False
+
+        with (TarFormSink(download_metadata) if download_metadata.sink == 'tar' else nullcontext()) as tar_sink:
+            # Filings already saved are skipped before any request is made, so they do not consume rate limit tokens.
+            # The check reads the filesystem or a whole archive index, so it runs off the event loop.
+            to_download = await asyncio.to_thread(
+                lambda: [td for td in to_download if not self._is_already_downloaded(download_metadata, td, tar_sink)])
+            return sum(await asyncio.gather(*[download_one(td, tar_sink) for td in to_download]))
+
+    def fetch_and_save_filings_for_companies(self, downloads_metadata: List[FormsDownloadMetadata]) -> List[int]:
+        """Fetch and save the filings of many companies concurrently on a single event loop.
+
+        Returns the number of downloaded filings for each entry of `downloads_metadata`.
+        """
+
+        async def fetch_all() -> List[int]:
+            semaphore = asyncio.Semaphore(MAX_DOWNLOAD_WORKERS)
+            async with self._async_client() as client:
+                results = await asyncio.gather(
+                    *[self.afetch_and_save_filings(client, download_metadata, semaphore)
+                      for download_metadata in downloads_metadata],
+                    return_exceptions=True)
+            for download_metadata, result in zip(downloads_metadata, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to download filings for {download_metadata.ticker}: {result}")
+            return [0 if isinstance(result, Exception) else result for result in results]
+
+        return run_coroutine_sync(fetch_all)
 
     def get_ticker_cik_name_mapping(self) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
         """Get the mapping from ticker to CIK and CIK to ticker."""
-        ticker_metadata = self._rate_limited_get(URL_CIK_MAPPING, host=HOST_WWW_SEC).json()
+        ticker_metadata = self._get_ticker_metadata()
 
         fields = ticker_metadata["fields"]
         ticker_data = ticker_metadata["data"]
@@ -130,15 +451,20 @@ class DownloadFormManager(BaseClient):
         # Find index that corresponds with the CIK and ticker fields
         cik_idx, ticker_idx, name_idx = fields.index("cik"), fields.index("ticker"), fields.index("name")
 
-        ticker_to_cik = {str(td[ticker_idx]).upper(): str(td[cik_idx]).zfill(CIK_LENGTH) for td in ticker_data}
-        cik_to_ticker = {cik: ticker for ticker, cik in ticker_to_cik.items()}
-        cik_to_name = {cik: name for name, cik in ticker_to_cik.items()}
+        # Build all three mappings in one pass, formatting each ticker and CIK only once
+        ticker_to_cik, cik_to_ticker, cik_to_name = {}, {}, {}
+        for td in ticker_data:
+            ticker = str(td[ticker_idx]).upper()
+            cik = str(td[cik_idx]).zfill(CIK_LENGTH)
+            ticker_to_cik[ticker] = cik
+            cik_to_ticker[cik] = ticker
+            cik_to_name[cik] = td[name_idx]
 
         return ticker_to_cik, cik_to_ticker, cik_to_name
 
     def get_ticker_dataframe(self) -> pd.DataFrame:
         """Get the ticker metadata as a pandas DataFrame."""
-        ticker_metadata = self._rate_limited_get(URL_CIK_MAPPING, host=HOST_WWW_SEC).json()
+        ticker_metadata = self._get_ticker_metadata()
         fields = ticker_metadata["fields"]  # ['cik', 'name', 'ticker', 'exchange']
         ticker_data = ticker_metadata["data"]
 
@@ -146,7 +472,8 @@ class DownloadFormManager(BaseClient):
         df = pd.DataFrame(ticker_data, columns=fields)
 
         # Ensure data types
-        df['cik'] = df['cik'].astype(str).str.zfill(CIK_LENGTH)
+        # Zero-pad the numeric CIKs in a single formatting pass rather than casting to str and then padding
+        df['cik'] = df['cik'].astype('int64').map(f'{{:0{CIK_LENGTH}d}}'.format)
         df['ticker'] = df['ticker'].str.upper()
 
         return df
@@ -0,0 +1,46 @@
+import threading
+import time
+
+from _constants import MAX_REQUESTS_PER_SECOND
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so a client that has been idle can burst
+    up to ``capacity`` requests before being throttled back to ``rate``.
+    """
+    __slots__ = ('rate', 'capacity', 'tokens', 'last', 'lock')
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds the caller has to wait before using it.
+
+        The bucket may go into debt, so concurrent callers are queued behind each other without sleeping while
+        holding the lock. Async callers can ``await asyncio.sleep(bucket.reserve())``.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Rate limiter shared by every client in the process, SEC's limit applies per user rather than per session. A capacity
+# of one spaces requests evenly, a larger burst on top of the refill could exceed the limit within a single second.
+# It lives here rather than in _BaseClient because that module is also imported as Modules.EDGAR.client._BaseClient,
+# which would give each import path its own bucket; this module is only ever imported as _TokenBucket.
+sec_rate_limiter = TokenBucket(rate=MAX_REQUESTS_PER_SECOND, capacity=1)
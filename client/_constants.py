@@ -1,14 +1,12 @@
 from datetime import date
 
-from pyrate_limiter import Duration, RequestRate
-
 # 10 requests per second rate limit set by SEC:
 # https://www.sec.gov/os/webmaster-faq#developers
-SEC_RATE_LIMIT = RequestRate(10, Duration.SECOND)
-#
 MAX_REQUESTS_PER_SECOND = 10
 MAX_RETRIES = 10
 BACKOFF_FACTOR = 1 / MAX_REQUESTS_PER_SECOND
+MAX_DOWNLOAD_WORKERS = 16
+HTTP_POOL_MAXSIZE = 2 * MAX_DOWNLOAD_WORKERS
 #
 DATE_FORMAT_TOKENS = "%Y-%m-%d"
 DEFAULT_BEFORE_DATE = date.today()
@@ -19,7 +17,8 @@ AMENDS_SUFFIX = "/A"
 HOST_WWW_SEC = "www.sec.gov"
 HOST_DATA_SEC = "data.sec.gov"
 #
-STANDARD_HEADERS = {"Accept-Encoding": "gzip, deflate", }
+# br is only decoded transparently by requests/httpx when brotli is installed
+STANDARD_HEADERS = {"Accept-Encoding": "gzip, deflate, br", }
 
 # SEC API endpoints as documented here:
 # https://www.sec.gov/edgar/sec-api-documentation
@@ -39,7 +38,7 @@ URL_XBRL_COMPANY_FACTS = f"{_BASE_URL_XBRL_COMPANY_FACTS}/CIK{{cik}}.json"
 URL_XBRL_FRAMES = f"{_BASE_URL_XBRL_FRAMES}/{{taxonomy}}/{{tag}}/{{unit}}/{{period}}.json"
 # 
 URL_CIK_MAPPING = f"https://{HOST_WWW_SEC}/files/company_tickers_exchange.json"
-URL_FILING = (f"https://{HOST_WWW_SEC}/Archives/edgar/data/{{cik}}/{{acc_num_no_dash}}/{{document}}")
+URL_FILINGS_ROOT = f"https://{HOST_WWW_SEC}/Archives/edgar/data"
 URL_XBRL_COMPANY_FACTS_ZIP = f"https://{HOST_WWW_SEC}/Archives/edgar/daily-index/xbrl/companyfacts.zip"
 URL_XBRL_COMPANY_SUBMISSIONS_ZIP = f"https://{HOST_WWW_SEC}/Archives/edgar/daily-index/xbrl/submissions.zip"
 
@@ -48,6 +47,10 @@ ROOT_FORMS_SAVE_FOLDER_NAME = "sec-edgar-filings"
 ROOT_FACTS_SAVE_FOLDER_NAME = "sec-edgar-facts"
 FORM_FULL_SUBMISSION_FILENAME = "full-submission.txt"
 PRIMARY_DOC_FILENAME_STEM = "primary-document"
+ZIP_DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+FORM_DOWNLOAD_CHUNK_SIZE = 1 << 16  # 64 KiB
+TICKER_CIK_CACHE_FILENAME = ".ticker_cik.parquet"
+TICKER_CIK_CACHE_TTL_SECONDS = 24 * 60 * 60
 
 CIK_LENGTH = 10
 
@@ -2,18 +2,19 @@ import sys
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal, Tuple
 from typing import Union
 
 from _constants import DEFAULT_AFTER_DATE, DEFAULT_BEFORE_DATE
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FormsDownloadMetadata:
     """Class for representing internal download metadata."""
 
     download_folder: Path
-    forms: List[str]  # Change this to a list
+    # A tuple rather than a list so instances are hashable
+    forms: Tuple[str, ...]
     cik: str
     ticker: str
     limit: int = sys.maxsize
@@ -21,9 +22,13 @@ class FormsDownloadMetadata:
     before: date = DEFAULT_BEFORE_DATE
     include_amends: bool = False
     download_details: bool = False
+    # Drop written filings from the OS page cache (POSIX only), useful for large batch downloads
+    advise_dontneed: bool = False
+    # 'fs' writes one file per filing document, 'tar' appends them to one archive per form
+    sink: Literal['fs', 'tar'] = 'fs'
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FormToDownload:
     form: str
     raw_filing_uri: str
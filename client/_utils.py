@@ -1,11 +1,10 @@
 from datetime import date
 from datetime import datetime as dt
-from itertools import chain
-from typing import Dict
+from typing import AbstractSet, Dict, Optional
 from typing import List
 
 from _constants import CIK_LENGTH, DATE_FORMAT_TOKENS
-from _types import FormsDownloadMetadata, SubmissionsType
+from _types import SubmissionsType
 
 
 def validate_cik(cik: str) -> str:
@@ -20,24 +19,22 @@ def validate_cik(cik: str) -> str:
 
 
 def is_cik(cik: str) -> bool:
-    try:
-        int(cik)
-        return 1 <= len(cik) <= 10
-    except ValueError:
-        return False
+    return cik.isdecimal() and 1 <= len(cik) <= 10
 
 
 def merge_submission_dicts(to_merge: List[SubmissionsType]) -> SubmissionsType:
     """Merge dictionaries with same keys."""
-    merged = {}
-    for k in to_merge[0].keys():
-        merged[k] = list(chain.from_iterable(d[k] for d in to_merge))
-    return merged
+    return {k: [x for d in to_merge for x in d[k]] for k in to_merge[0]}
 
 
 def validate_and_return_cik(
-        ticker_or_cik: str, ticker_to_cik_mapping: Dict[str, str]
+        ticker_or_cik: str, ticker_to_cik_mapping: Dict[str, str], cik_set: Optional[AbstractSet[str]] = None
 ) -> str:
+    """Return the zero-padded CIK of a ticker or CIK.
+
+    `cik_set` holds every CIK of `ticker_to_cik_mapping` for constant time membership checks, callers validating
+    many inputs should precompute it once, otherwise the mapping values are scanned.
+    """
     ticker_or_cik = str(ticker_or_cik).strip().upper()
 
     # Check for blank tickers or CIKs
@@ -52,7 +49,7 @@ def validate_and_return_cik(
         # to ensure that it is exactly 10 digits long
         cik = ticker_or_cik.zfill(CIK_LENGTH)
         # make sure it exists in the mapping
-        if cik not in ticker_to_cik_mapping.values():
+        if cik not in (ticker_to_cik_mapping.values() if cik_set is None else cik_set):
             raise ValueError(
                 "Invalid CIK. Not present in the CIK to ticker mapping."
             )
@@ -75,6 +72,14 @@ def validate_and_parse_date(date_format: str) -> date:
     if not isinstance(date_format, str):
         raise TypeError(error_msg_base)
 
+    # Since Python 3.11 fromisoformat also takes other ISO 8601 forms (e.g. 20230101 or 2023-W01-1), so it is only a
+    # fast path for strings already shaped like YYYY-MM-DD
+    if len(date_format) == 10 and date_format[4] == date_format[7] == '-':
+        try:
+            return date.fromisoformat(date_format)
+        except ValueError:
+            pass
+    # Fall back to strptime for the looser inputs it accepts, e.g. unpadded months and days
     try:
         return dt.strptime(date_format, DATE_FORMAT_TOKENS).date()
     except ValueError as exc:
@@ -82,13 +87,6 @@ def validate_and_parse_date(date_format: str) -> date:
         raise ValueError(f"Incorrect date format. {error_msg_base}") from exc
 
 
-def within_requested_date_range(
-        download_metadata: FormsDownloadMetadata,
-        filing_date: str,
-) -> bool:
-    target_date = dt.strptime(filing_date, DATE_FORMAT_TOKENS).date()
-    return download_metadata.after <= target_date <= download_metadata.before
-
 def get_valid_after_date(after, after_date):
     if after is None:
         return after_date
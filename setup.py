@@ -14,11 +14,14 @@ setup(
     license="MIT",
     install_requires=[
         "requests",
+        "httpx[http2]",
         "bs4",
         "faker",
-        "pyrate-limiter",
         "pandas",
-        "numpy"
+        "pyarrow",
+        "numpy",
+        "orjson",
+        "brotli"
     ]
 )
 
@@ -0,0 +1,12 @@
+import sys
+import types
+from pathlib import Path
+
+# The client modules import each other both bare (`from _constants import ...`) and through the
+# `Modules.EDGAR.client` package of the application they are vendored into, so expose the folder under both names
+CLIENT_DIR = Path(__file__).resolve().parents[1] / "client"
+sys.path.insert(0, str(CLIENT_DIR))
+for name, path in (("Modules", []), ("Modules.EDGAR", []), ("Modules.EDGAR.client", [str(CLIENT_DIR)])):
+    package = types.ModuleType(name)
+    package.__path__ = path
+    sys.modules.setdefault(name, package)
@@ -0,0 +1,234 @@
+import asyncio
+import sys
+import tarfile
+from datetime import date
+
+import httpx
+import orjson
+import pytest
+import requests
+
+import _AsyncBaseClient
+import EdgarClient
+from EdgarAPIError import EdgarAPIError
+from _BaseClient import BaseClient
+from _constants import FORM_FULL_SUBMISSION_FILENAME, PRIMARY_DOC_FILENAME_STEM, ROOT_FORMS_SAVE_FOLDER_NAME
+from _types import FormsDownloadMetadata
+
+TICKERS_PAYLOAD = orjson.dumps({
+    "fields": ["cik", "name", "ticker", "exchange"],
+    "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"]],
+})
+SUBMISSIONS_PAYLOAD = orjson.dumps({
+    "filings": {
+        "recent": {
+            "accessionNumber": ["0000320193-23-000106", "0000320193-22-000108"],
+            "form": ["10-K", "10-K"],
+            "primaryDocument": ["aapl-20230930.htm", "aapl-20220924.htm"],
+            "filingDate": ["2023-11-03", "2022-10-28"],
+        },
+        "files": [],
+    },
+})
+
+
+class _TickersResponse:
+    content = TICKERS_PAYLOAD
+
+
+@pytest.fixture
+def sec_client(tmp_path, monkeypatch):
+    # No ticker cache on disk, so construction goes through the cold start path
+    monkeypatch.setattr(EdgarClient.SEC_Client, "_rate_limited_get", lambda self, *args, **kwargs: _TickersResponse())
+    return EdgarClient.SEC_Client("Sample Company", "admin@sample.com", download_folder=tmp_path)
+
+
+def test_rss_get_follows_redirects(tmp_path, monkeypatch):
+    feed_url = "http://www.sec.gov/rss/litigation/suspensions.xml"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.scheme == "http":
+            return httpx.Response(301, headers={"Location": str(request.url.copy_with(scheme="https"))})
+        return httpx.Response(200, content=b"<rss><channel><item><title>halt</title></item></channel></rss>")
+
+    monkeypatch.setattr(EdgarClient.httpx, "HTTPTransport", lambda *args, **kwargs: httpx.MockTransport(handler))
+    monkeypatch.setattr(EdgarClient.SEC_Client, "_rate_limited_get", lambda self, *args, **kwargs: _TickersResponse())
+    sec_client = EdgarClient.SEC_Client("Sample Company", "admin@sample.com", download_folder=tmp_path)
+
+    response = sec_client._rate_limited_rss_get(feed_url)
+    assert response.status_code == 200
+    assert response.url == "https://www.sec.gov/rss/litigation/suspensions.xml"
+    assert len(EdgarClient.feedparser.parse(response.content).entries) == 1
+
+
+def test_cold_start_mappings(sec_client):
+    assert sec_client.ticker_to_cik_mapping == {"AAPL": "0000320193"}
+    assert sec_client.cik_to_ticker_mapping == {"0000320193": "AAPL"}
+    assert sec_client.cik_to_name == {"0000320193": "Apple Inc."}
+
+
+def mock_sec(monkeypatch, failing_paths=()):
+    """Serve SUBMISSIONS_PAYLOAD and dummy documents to the async client, returning the recorded requests."""
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path.startswith("/submissions/"):
+            return httpx.Response(200, content=SUBMISSIONS_PAYLOAD)
+        if request.url.path.startswith("/api/xbrl/companyfacts/"):
+            return httpx.Response(200, content=orjson.dumps({"cik": 320193, "facts": {}}))
+        if request.url.path in failing_paths:
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"filing " + request.url.path.encode())
+
+    monkeypatch.setattr(_AsyncBaseClient.httpx, "AsyncHTTPTransport",
+                        lambda *args, **kwargs: httpx.MockTransport(handler))
+    return requests_seen
+
+
+def test_fetch_and_save_filings_for_companies(sec_client, tmp_path, monkeypatch):
+    requests_seen = mock_sec(monkeypatch)
+    download_metadata = FormsDownloadMetadata(tmp_path, ("10-K",), "0000320193", "AAPL", limit=1)
+
+    async def notebook_cell():
+        return sec_client.fetch_and_save_filings_for_companies([download_metadata])
+
+    assert asyncio.run(notebook_cell()) == [1]
+    assert all(request.headers["User-Agent"] == "Sample Company admin@sample.com" for request in requests_seen)
+    saved = (tmp_path / ROOT_FORMS_SAVE_FOLDER_NAME / "AAPL-0000320193" / "10-K" / "0000320193-23-000106"
+             / FORM_FULL_SUBMISSION_FILENAME)
+    assert saved.read_bytes() == b"filing /Archives/edgar/data/320193/000032019323000106/0000320193-23-000106.txt"
+
+
+def test_tar_sink_keeps_earlier_filings(sec_client, tmp_path, monkeypatch):
+    mock_sec(monkeypatch, failing_paths={"/Archives/edgar/data/320193/000032019322000108/aapl-20220924.htm"})
+    archive_path = tmp_path / ROOT_FORMS_SAVE_FOLDER_NAME / "AAPL-0000320193" / "10-K.tar"
+
+    def archived_names():
+        with tarfile.open(archive_path) as tar:
+            return sorted(tar.getnames())
+
+    raw_only = FormsDownloadMetadata(tmp_path, ("10-K",), "0000320193", "AAPL", sink="tar")
+    assert sec_client.fetch_and_save_filings_for_companies([raw_only]) == [2]
+    # A later, narrower run appends to the archive instead of replacing it
+    with_details = FormsDownloadMetadata(tmp_path, ("10-K",), "0000320193", "AAPL", after=date(2023, 1, 1),
+                                         download_details=True, sink="tar")
+    assert sec_client.fetch_and_save_filings_for_companies([with_details]) == [1]
+    # The 2022 primary document fails, so none of that filing's documents are added by this run
+    with_details = FormsDownloadMetadata(tmp_path, ("10-K",), "0000320193", "AAPL", download_details=True, sink="tar")
+    assert sec_client.fetch_and_save_filings_for_companies([with_details]) == [0]
+    assert archived_names() == [
+        f"0000320193-22-000108/{FORM_FULL_SUBMISSION_FILENAME}",
+        f"0000320193-23-000106/{FORM_FULL_SUBMISSION_FILENAME}",
+        f"0000320193-23-000106/{PRIMARY_DOC_FILENAME_STEM}.html",
+    ]
+
+
+def test_download_facts_for_companies_inside_running_loop(sec_client, monkeypatch):
+    mock_sec(monkeypatch)
+
+    async def notebook_cell():
+        return sec_client.download_facts_for_companies(["AAPL", "NOPE"])
+
+    assert asyncio.run(notebook_cell()) == (["AAPL"], ["NOPE"])
+    assert len(list(sec_client.facts_save_folder.glob("AAPL-facts-*.json"))) == 1
+
+
+def _fact(val, **fields):
+    return {"end": "2023-09-30", "val": val, "accn": "0000320193-23-000106", "fy": 2023, "fp": "FY", "form": "10-K",
+            "filed": "2023-11-03", **fields}
+
+
+def test_parse_facts_json_keeps_integer_columns():
+    large = 2 ** 53 + 1
+    facts = {"entityName": "Apple Inc.", "facts": {"us-gaap": {
+        "Revenues": {"units": {"USD": [_fact(large), _fact(1)]}},
+        "EarningsPerShareBasic": {"units": {"USD/shares": [_fact(6.16), _fact(6.15)]}},
+    }}}
+    facts_df = EdgarClient.SEC_Client.parse_facts_json(facts)
+
+    assert facts_df[("us-gaap", "Revenues", "USD", "val")].dtype == "int64"
+    assert facts_df[("us-gaap", "Revenues", "USD", "val")].iloc[0] == large
+    assert facts_df[("us-gaap", "Revenues", "USD", "fy")].dtype == "int64"
+    assert facts_df[("us-gaap", "EarningsPerShareBasic", "USD/shares", "val")].dtype == "float64"
+
+
+def test_parse_facts_json_checks_each_unit_schema():
+    missing_fy = _fact(1)
+    del missing_fy["fy"]
+    facts = {"entityName": "Apple Inc.", "facts": {"us-gaap": {
+        "Revenues": {"units": {"USD": [_fact(1)]}},
+        "Assets": {"units": {"USD": [missing_fy]}},
+    }}}
+    with pytest.raises(SystemExit):
+        EdgarClient.SEC_Client.parse_facts_json(facts)
+
+
+def test_streamed_error_response_is_closed(sec_client, monkeypatch):
+    closed = []
+
+    class ErrorResponse:
+        status_code = 404
+        url = "https://www.sec.gov/Archives/missing.txt"
+
+        def raise_for_status(self):
+            raise requests.exceptions.HTTPError("404 Client Error")
+
+        def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr(sec_client._session, "get", lambda *args, **kwargs: ErrorResponse())
+    with pytest.raises(EdgarAPIError):
+        BaseClient._rate_limited_get(sec_client, ErrorResponse.url, stream=True)
+    assert closed == [True]
+
+
+def test_fetch_and_save_filings_streams_through_sync_wrapper(sec_client, tmp_path, monkeypatch):
+    body = bytes(range(256)) * 1024
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/submissions/"):
+            return httpx.Response(200, content=SUBMISSIONS_PAYLOAD)
+        attempts.append(request.url.path)
+        # The first attempt is retried like the sync client's adapter would
+        if len(attempts) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, content=body)
+
+    monkeypatch.setattr(_AsyncBaseClient.httpx, "AsyncHTTPTransport",
+                        lambda *args, **kwargs: httpx.MockTransport(handler))
+    monkeypatch.setattr(_AsyncBaseClient, "BACKOFF_FACTOR", 0)
+    download_metadata = FormsDownloadMetadata(tmp_path, ("10-K",), "0000320193", "AAPL", limit=1)
+
+    assert sec_client.fetch_and_save_filings(download_metadata) == 1
+    assert len(attempts) == 2
+    filing_folder = tmp_path / ROOT_FORMS_SAVE_FOLDER_NAME / "AAPL-0000320193" / "10-K" / "0000320193-23-000106"
+    assert (filing_folder / FORM_FULL_SUBMISSION_FILENAME).read_bytes() == body
+    assert [path.name for path in filing_folder.iterdir()] == [FORM_FULL_SUBMISSION_FILENAME]
+
+
+def test_download_metadata_is_hashable(tmp_path):
+    download_metadata = FormsDownloadMetadata(tmp_path, ("10-K", "10-Q"), "0000320193", "AAPL")
+    same = FormsDownloadMetadata(tmp_path, ("10-K", "10-Q"), "0000320193", "AAPL")
+    assert {download_metadata: 1}[same] == 1
+
+
+def test_tar_sinks_for_the_same_company_share_an_archive(sec_client, tmp_path, monkeypatch):
+    mock_sec(monkeypatch)
+    # Two requests for the same company and form run concurrently and append to the same archive
+    latest = FormsDownloadMetadata(tmp_path, ("10-K",), "0000320193", "AAPL", limit=1, sink="tar")
+    older = FormsDownloadMetadata(tmp_path, ("10-K",), "0000320193", "AAPL", before=date(2022, 12, 31), sink="tar")
+
+    assert sec_client.fetch_and_save_filings_for_companies([latest, older]) == [1, 1]
+    with tarfile.open(tmp_path / ROOT_FORMS_SAVE_FOLDER_NAME / "AAPL-0000320193" / "10-K.tar") as tar:
+        assert sorted(tar.getnames()) == [f"0000320193-22-000108/{FORM_FULL_SUBMISSION_FILENAME}",
+                                          f"0000320193-23-000106/{FORM_FULL_SUBMISSION_FILENAME}"]
+
+
+def test_sync_and_async_paths_share_one_rate_limiter(sec_client):
+    # _BaseClient is loaded under both its bare and its package name, each copy must still hand out the same bucket
+    bare, packaged = sys.modules["_BaseClient"], sys.modules["Modules.EDGAR.client._BaseClient"]
+    assert bare is not packaged
+    assert bare.sec_rate_limiter is packaged.sec_rate_limiter is _AsyncBaseClient.AsyncBaseClient._bucket
+    assert sec_client._bucket is bare.sec_rate_limiter
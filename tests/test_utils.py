@@ -0,0 +1,19 @@
+from datetime import date
+
+import pytest
+
+from _utils import validate_and_parse_date
+
+
+@pytest.mark.parametrize("date_string, expected", [
+    ("2023-01-01", date(2023, 1, 1)),
+    ("2023-1-1", date(2023, 1, 1)),
+])
+def test_validate_and_parse_date(date_string, expected):
+    assert validate_and_parse_date(date_string) == expected
+
+
+@pytest.mark.parametrize("date_string", ["20230101", "2023-W01-1", "2023-13-01", "2023/01/01", ""])
+def test_validate_and_parse_date_rejects_other_formats(date_string):
+    with pytest.raises(ValueError, match="Incorrect date format"):
+        validate_and_parse_date(date_string)